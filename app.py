@@ -1,7 +1,13 @@
+import io
 import os
-from flask import Flask, request, jsonify, send_file
+import shutil
+from functools import wraps
+
+import orjson
+from flask import Flask, Response, request, send_file, stream_with_context
 from flask_restx import Api, Resource, fields
 from flask_cors import CORS
+from flask_caching import Cache
 from database import db
 from models import Work, Category
 from config import Config
@@ -12,9 +18,17 @@ from werkzeug.utils import secure_filename
 app = Flask(__name__)
 app.config.from_object(Config)
 
+class ORJSONResponse(Response):
+    default_mimetype = 'application/json'
+
+def _json(obj):
+    """jsonify replacement encoding with orjson; handles datetime natively"""
+    return ORJSONResponse(orjson.dumps(obj))
+
 # Initialize extensions
 db.init_app(app)
 CORS(app)
+cache = Cache(app)
 
 # Create upload directory
 os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
@@ -52,7 +66,70 @@ category_model = api.model('Category', {
 
 # Utility functions
 def allowed_file(filename):
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ['pdf']
+    # Single C-level suffix check; no rsplit list allocation
+    return filename.lower().endswith('.pdf')
+
+def _save_upload(stream, filepath):
+    """Write an uploaded stream to disk without copying through Python.
+
+    Large uploads are spooled to a real temp file by Werkzeug, so their bytes
+    can be moved with os.sendfile entirely in kernel space; in-memory streams
+    (small uploads) fall back to a 1 MB-chunked copy.
+    """
+    with open(filepath, 'wb') as dst:
+        try:
+            src_fd = stream.fileno()
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            shutil.copyfileobj(stream, dst, 1024 * 1024)
+            return
+        offset = 0
+        while True:
+            sent = os.sendfile(dst.fileno(), src_fd, offset, 1024 * 1024)
+            if sent == 0:
+                break
+            offset += sent
+
+# Columns fetched for read-only listings; selecting plain columns returns
+# lightweight Row tuples instead of instrumented ORM instances
+_WORK_COLS = (
+    Work.id, Work.title, Work.abstract, Work.author_name, Work.year,
+    Work.field, Work.school, Work.region, Work.category,
+    Work.pdf_filename, Work.approved, Work.created_at
+)
+
+def _work_row_to_dict(row):
+    return {
+        'id': row.id,
+        'title': row.title,
+        'abstract': row.abstract,
+        'author_name': row.author_name,
+        'year': row.year,
+        'field': row.field,
+        'school': row.school,
+        'region': row.region,
+        'category': row.category,
+        'pdf_url': f"/api/works/{row.id}/pdf" if row.pdf_filename else None,
+        'approved': row.approved,
+        'created_at': row.created_at
+    }
+
+def _conditional(f):
+    """Turn a matching If-None-Match into a 304 for a tagged response.
+
+    Applied outside cache.cached, so even cache hits answer polls with a
+    bodyless 304 instead of re-sending the payload.
+    """
+    @wraps(f)
+    def wrapper(*args, **kwargs):
+        response = f(*args, **kwargs)
+        return response.make_conditional(request)
+    return wrapper
+
+def _invalidate_work_cache(work_id):
+    # Mirrors flask-caching's default 'view/<request.path>' key scheme; the
+    # works listing is keyed by hashed query string, so it is not addressable
+    # here and instead expires via its short timeout
+    cache.delete(f'view//works/{work_id}')
 
 # Routes
 @works_ns.route('/')
@@ -64,45 +141,67 @@ class WorkList(Resource):
     @works_ns.param('school', 'Filter by school')
     @works_ns.param('region', 'Filter by region')
     @works_ns.param('category', 'Filter by category')
+    @works_ns.param('limit', 'Page size (max 500, default 50)')
+    @works_ns.param('after_id', 'Return works with id greater than this (keyset pagination)')
+    @cache.cached(timeout=30, query_string=True)
     def get(self):
         """Get all works with filtering and search"""
-        query = Work.query.filter_by(approved=True)
-        
+        stmt = db.select(*_WORK_COLS).where(Work.approved == True)
+
         # Search in title, abstract, and author name
         search = request.args.get('search')
         if search:
-            query = query.filter(
-                db.or_(
-                    Work.title.contains(search),
-                    Work.abstract.contains(search),
-                    Work.author_name.contains(search),
-                    Work.field.contains(search)
+            if db.engine.dialect.name == 'postgresql':
+                # Index-backed full-text search on the stored tsvector column
+                stmt = stmt.where(
+                    db.text("search_vector @@ websearch_to_tsquery('simple', :search)")
+                    .bindparams(search=search)
                 )
-            )
-        
+            else:
+                # SQLite dev fallback: substring match, full scan
+                stmt = stmt.where(
+                    db.or_(
+                        Work.title.contains(search),
+                        Work.abstract.contains(search),
+                        Work.author_name.contains(search),
+                        Work.field.contains(search)
+                    )
+                )
+
         # Filters
         field = request.args.get('field')
         if field:
-            query = query.filter(Work.field == field)
-            
+            stmt = stmt.where(Work.field == field)
+
         year = request.args.get('year')
         if year:
-            query = query.filter(Work.year == year)
-            
+            stmt = stmt.where(Work.year == year)
+
         school = request.args.get('school')
         if school:
-            query = query.filter(Work.school.contains(school))
-            
+            stmt = stmt.where(Work.school.contains(school))
+
         region = request.args.get('region')
         if region:
-            query = query.filter(Work.region == region)
-            
+            stmt = stmt.where(Work.region == region)
+
         category = request.args.get('category')
         if category:
-            query = query.filter(Work.category == category)
-        
-        works = query.all()
-        return jsonify([work.to_dict() for work in works])
+            stmt = stmt.where(Work.category == category)
+
+        # Keyset pagination: O(limit) per page via an index scan on id,
+        # with no OFFSET re-scan of earlier pages
+        limit = max(1, min(request.args.get('limit', 50, type=int) or 50, 500))
+        after_id = request.args.get('after_id', type=int)
+        if after_id:
+            stmt = stmt.where(Work.id > after_id)
+        stmt = stmt.order_by(Work.id).limit(limit)
+
+        rows = db.session.execute(stmt).all()
+        return _json({
+            'items': [_work_row_to_dict(row) for row in rows],
+            'next_after_id': rows[-1].id if len(rows) == limit else None
+        })
 
     @works_ns.doc('create_work')
     @works_ns.expect(work_model)
@@ -132,10 +231,15 @@ class WorkList(Resource):
 @works_ns.response(404, 'Work not found')
 class WorkDetail(Resource):
     @works_ns.doc('get_work')
+    @_conditional
+    @cache.cached(timeout=60)
     def get(self, work_id):
         """Get a specific work"""
         work = Work.query.get_or_404(work_id)
-        return work.to_dict()
+        response = _json(work.to_dict())
+        # Full-precision timestamp: same-second updates must still change the tag
+        response.set_etag(f"{work.id}-{work.updated_at.timestamp()}", weak=True)
+        return response
 
 @works_ns.route('/<int:work_id>/pdf')
 @works_ns.response(404, 'Work or PDF not found')
@@ -147,7 +251,22 @@ class WorkPDF(Resource):
             return {'message': 'PDF not available'}, 404
             
         pdf_path = os.path.join(app.config['UPLOAD_FOLDER'], work.pdf_filename)
-        return send_file(pdf_path, as_attachment=True)
+
+        accel_prefix = app.config.get('PDF_ACCEL_REDIRECT_PREFIX')
+        if accel_prefix:
+            # Hand the transfer to nginx via its internal location; no file
+            # bytes pass through Python
+            response = Response(mimetype='application/pdf')
+            response.headers['X-Accel-Redirect'] = f"{accel_prefix}/{work.pdf_filename}"
+            response.headers['Content-Disposition'] = (
+                f'attachment; filename="{work.pdf_filename}"'
+            )
+            return response
+
+        response = send_file(pdf_path, as_attachment=True, conditional=True,
+                             download_name=work.pdf_filename, max_age=86400)
+        response.set_etag(f"{work.id}-{int(os.path.getmtime(pdf_path))}")
+        return response.make_conditional(request)
 
 @works_ns.route('/<int:work_id>/gdpr')
 @works_ns.response(404, 'Work not found')
@@ -159,17 +278,19 @@ class WorkGDPR(Resource):
         # Anonymize personal data
         work.author_name = "Anonymizováno"
         work.author_email = None
-        
+
         db.session.commit()
-        
+        _invalidate_work_cache(work_id)
+
         return {'message': 'Personal data removed'}
 
 @categories_ns.route('/')
 class CategoryList(Resource):
+    @cache.cached(timeout=300)
     def get(self):
         """Get all categories"""
         categories = Category.query.all()
-        return jsonify([category.to_dict() for category in categories])
+        return _json([category.to_dict() for category in categories])
     
     @categories_ns.doc('create_category')
     @categories_ns.expect(category_model)
@@ -184,7 +305,8 @@ class CategoryList(Resource):
         
         db.session.add(category)
         db.session.commit()
-        
+        cache.delete('view//categories/')
+
         return category.to_dict(), 201
 
 @admin_ns.route('/works/<int:work_id>/approve')
@@ -194,6 +316,7 @@ class WorkApproval(Resource):
         work = Work.query.get_or_404(work_id)
         work.approved = True
         db.session.commit()
+        _invalidate_work_cache(work_id)
         return {'message': 'Work approved'}
 
 @admin_ns.route('/works/<int:work_id>/pdf')
@@ -212,11 +335,12 @@ class WorkPDFUpload(Resource):
         if file and allowed_file(file.filename):
             filename = secure_filename(f"work_{work_id}_{file.filename}")
             filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-            file.save(filepath)
+            _save_upload(file.stream, filepath)
             
             work.pdf_filename = filename
             db.session.commit()
-            
+            _invalidate_work_cache(work_id)
+
             return {'message': 'PDF uploaded successfully'}
         
         return {'message': 'Invalid file type'}, 400
@@ -225,50 +349,87 @@ class WorkPDFUpload(Resource):
 class Statistics(Resource):
     def get(self):
         """Get statistics about works"""
-        total_works = Work.query.count()
-        approved_works = Work.query.filter_by(approved=True).count()
-        
-        # Works by year
-        years = db.session.query(Work.year, db.func.count(Work.id)).group_by(Work.year).all()
-        
-        # Works by field
-        fields = db.session.query(Work.field, db.func.count(Work.id)).group_by(Work.field).all()
-        
+        # Total and approved counts in a single scan
+        total_works, approved_works = db.session.execute(
+            db.select(
+                db.func.count(Work.id),
+                db.func.sum(db.case((Work.approved == True, 1), else_=0))
+            )
+        ).one()
+
+        if db.engine.dialect.name == 'postgresql':
+            # Both breakdowns in one scan via GROUPING SETS; year and field
+            # are NOT NULL, so the NULL column tells the sets apart
+            rows = db.session.execute(db.text(
+                "SELECT year, field, count(*) FROM works "
+                "GROUP BY GROUPING SETS ((year), (field))"
+            )).all()
+            works_by_year = {year: count for year, field, count in rows if field is None}
+            works_by_field = {field: count for year, field, count in rows if year is None}
+        else:
+            # SQLite has no GROUPING SETS; fall back to one query per breakdown
+            works_by_year = dict(db.session.execute(
+                db.select(Work.year, db.func.count(Work.id)).group_by(Work.year)
+            ).all())
+            works_by_field = dict(db.session.execute(
+                db.select(Work.field, db.func.count(Work.id)).group_by(Work.field)
+            ).all())
+
         return {
             'total_works': total_works,
-            'approved_works': approved_works,
-            'works_by_year': dict(years),
-            'works_by_field': dict(fields)
+            'approved_works': int(approved_works or 0),
+            'works_by_year': works_by_year,
+            'works_by_field': works_by_field
         }
 
 @admin_ns.route('/export')
 class ExportData(Resource):
     def get(self):
         """Export works data as JSON"""
-        works = Work.query.all()
-        data = [work.to_dict() for work in works]
-        return jsonify(data)
+        def generate():
+            # yield_per keeps only one batch of rows in memory at a time
+            result = db.session.execute(
+                db.select(*_WORK_COLS).execution_options(yield_per=500)
+            ).mappings()
+            yield b'['
+            first = True
+            for row in result:
+                prefix = b'' if first else b','
+                first = False
+                # orjson wants a real dict; dict(row) copies the RowMapping
+                # in one C-level call instead of a per-field literal build
+                yield prefix + orjson.dumps(dict(row))
+            yield b']'
+
+        return Response(stream_with_context(generate()), mimetype='application/json')
 
 # Health check endpoint
 @app.route('/api/health')
 def health_check():
-    return jsonify({'status': 'healthy', 'message': 'SOČ Archive API is running'})
+    return _json({'status': 'healthy', 'message': 'SOČ Archive API is running'})
 
 # Initialize database
 with app.app_context():
     db.create_all()
     
-    # Add some sample categories if none exist
+    # Add some sample categories if none exist; a single bulk INSERT instead
+    # of one ORM statement per row
     if Category.query.count() == 0:
-        sample_categories = [
-            Category(name="Matematika", description="Matematické práce"),
-            Category(name="Fyzika", description="Fyzikální práce"),
-            Category(name="Informatika", description="Informatické práce"),
-            Category(name="Biologie", description="Biologické práce"),
-            Category(name="Chemie", description="Chemické práce")
-        ]
-        db.session.add_all(sample_categories)
+        db.session.execute(db.insert(Category), [
+            {"name": "Matematika", "description": "Matematické práce"},
+            {"name": "Fyzika", "description": "Fyzikální práce"},
+            {"name": "Informatika", "description": "Informatické práce"},
+            {"name": "Biologie", "description": "Biologické práce"},
+            {"name": "Chemie", "description": "Chemické práce"}
+        ])
         db.session.commit()
+        if db.engine.dialect.name == 'postgresql':
+            # Refresh planner statistics so the fresh seed rows are visible;
+            # ANALYZE is transactional, so commit it or teardown rolls it back
+            db.session.execute(db.text('ANALYZE categories'))
+            db.session.commit()
 
 if __name__ == '__main__':
+    # Development server only - single-threaded, requests serialize.
+    # In production run: gunicorn -c gunicorn.conf.py wsgi:application
     app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
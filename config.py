@@ -7,5 +7,29 @@ class Config:
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'dev-secret-key'
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or 'sqlite:///soc_archive.db'
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # Explicit pool sizing for concurrent workers; pre-ping discards stale
+    # connections instead of failing a request on them
+    if SQLALCHEMY_DATABASE_URI.startswith('sqlite'):
+        SQLALCHEMY_ENGINE_OPTIONS = {
+            'pool_pre_ping': True,
+            'connect_args': {'check_same_thread': False}
+        }
+    else:
+        SQLALCHEMY_ENGINE_OPTIONS = {
+            'pool_size': 20,
+            'max_overflow': 10,
+            'pool_pre_ping': True,
+            'pool_recycle': 1800
+        }
     UPLOAD_FOLDER = 'static/pdfs'
-    MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB max file size
\ No newline at end of file
+    MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB max file size
+    # Let the front server (Apache/nginx mod_xsendfile) serve PDF bytes instead
+    # of streaming them through Python; off by default for the dev server
+    USE_X_SENDFILE = os.environ.get('USE_X_SENDFILE', '').lower() in ('1', 'true', 'yes')
+    # nginx variant: internal location prefix mapped to UPLOAD_FOLDER,
+    # e.g. '/protected/pdfs' with an internal alias in the nginx config
+    PDF_ACCEL_REDIRECT_PREFIX = os.environ.get('PDF_ACCEL_REDIRECT_PREFIX')
+    # Response cache: Redis when CACHE_REDIS_URL is set, in-process otherwise
+    CACHE_TYPE = 'RedisCache' if os.environ.get('CACHE_REDIS_URL') else 'SimpleCache'
+    CACHE_REDIS_URL = os.environ.get('CACHE_REDIS_URL')
+    CACHE_DEFAULT_TIMEOUT = 300
\ No newline at end of file
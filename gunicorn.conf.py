@@ -0,0 +1,7 @@
+import multiprocessing
+
+bind = '0.0.0.0:5000'
+workers = multiprocessing.cpu_count() * 2 + 1
+worker_class = 'gevent'
+worker_connections = 1000
+keepalive = 30
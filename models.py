@@ -1,9 +1,31 @@
+import operator
+
 from database import db
 from datetime import datetime
 
+# Scalar fields serialized by Work.to_dict; a single attrgetter call reads
+# them all instead of going through one descriptor lookup per field
+_WORK_KEYS = ('id', 'title', 'abstract', 'author_name', 'year', 'field',
+              'school', 'region', 'category', 'approved')
+_WORK_GET = operator.attrgetter(*_WORK_KEYS)
+
+# Expression kept in sync with the columns searched by /works/?search=...
+_FTS_EXPRESSION = (
+    "to_tsvector('simple', coalesce(title,'') || ' ' || coalesce(abstract,'') || ' ' || "
+    "coalesce(author_name,'') || ' ' || coalesce(field,''))"
+)
+
 class Work(db.Model):
     __tablename__ = 'works'
-    
+    __table_args__ = (
+        # Composite index for the common listing query; on Postgres it is a
+        # partial index restricted to the approved rows the listing serves
+        db.Index('ix_works_approved_year_field', 'approved', 'year', 'field',
+                 postgresql_where=db.text('approved = true')),
+        db.Index('ix_works_region', 'region'),
+        db.Index('ix_works_category', 'category'),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(200), nullable=False)
     abstract = db.Column(db.Text, nullable=False)
@@ -21,31 +43,55 @@ class Work(db.Model):
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     def to_dict(self):
-        return {
-            'id': self.id,
-            'title': self.title,
-            'abstract': self.abstract,
-            'author_name': self.author_name,
-            'year': self.year,
-            'field': self.field,
-            'school': self.school,
-            'region': self.region,
-            'category': self.category,
-            'pdf_url': f"/api/works/{self.id}/pdf" if self.pdf_filename else None,
-            'approved': self.approved,
-            'created_at': self.created_at.isoformat()
-        }
+        d = dict(zip(_WORK_KEYS, _WORK_GET(self)))
+        d['pdf_url'] = f"/api/works/{d['id']}/pdf" if self.pdf_filename else None
+        d['created_at'] = self.created_at.isoformat()
+        return d
+
+# Full-text search support (Postgres only): a stored tsvector column searched
+# with @@ websearch_to_tsquery and backed by a GIN index. SQLite dev databases
+# skip this DDL and keep the LIKE fallback in the search endpoint.
+db.event.listen(
+    Work.__table__,
+    'after_create',
+    db.DDL(
+        f"ALTER TABLE works ADD COLUMN search_vector tsvector "
+        f"GENERATED ALWAYS AS ({_FTS_EXPRESSION}) STORED"
+    ).execute_if(dialect='postgresql')
+)
+db.event.listen(
+    Work.__table__,
+    'after_create',
+    db.DDL(
+        "CREATE INDEX ix_works_fts ON works USING gin (search_vector)"
+    ).execute_if(dialect='postgresql')
+)
+
+# Trigram index so the school filter's LIKE '%...%' becomes an index lookup
+# on Postgres; a plain B-tree can never serve a leading-wildcard LIKE
+db.event.listen(
+    Work.__table__,
+    'after_create',
+    db.DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect='postgresql')
+)
+db.event.listen(
+    Work.__table__,
+    'after_create',
+    db.DDL(
+        "CREATE INDEX ix_works_school_trgm ON works USING gin (school gin_trgm_ops)"
+    ).execute_if(dialect='postgresql')
+)
 
 class Category(db.Model):
     __tablename__ = 'categories'
-    
+
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), nullable=False)
     description = db.Column(db.Text)
-    
+
     def to_dict(self):
         return {
             'id': self.id,
             'name': self.name,
             'description': self.description
-        }
\ No newline at end of file
+        }
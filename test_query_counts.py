@@ -0,0 +1,61 @@
+"""Regression tests: list endpoints must not fan out into N+1 queries."""
+
+import os
+import tempfile
+
+import pytest
+from sqlalchemy import event
+
+# Point the app at a throwaway database before it is imported
+os.environ['DATABASE_URL'] = 'sqlite:///' + tempfile.mkstemp(suffix='.db')[1]
+
+from app import app  # noqa: E402
+from database import db  # noqa: E402
+from models import Work  # noqa: E402
+
+
+@pytest.fixture
+def client():
+    with app.app_context():
+        db.create_all()
+        db.session.add_all([
+            Work(title=f'Práce {i}', abstract='Abstrakt', author_name='Autor',
+                 year=2024, field='Informatika', approved=True)
+            for i in range(10)
+        ])
+        db.session.commit()
+    with app.test_client() as test_client:
+        yield test_client
+    with app.app_context():
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def count_queries():
+    with app.app_context():
+        engine = db.engine
+
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context,
+                              executemany):
+        statements.append(statement)
+
+    event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    yield statements
+    event.remove(engine, 'before_cursor_execute', before_cursor_execute)
+
+
+def test_work_listing_query_count(client, count_queries):
+    response = client.get('/works/?year=2024')
+    assert response.status_code == 200
+    assert len(response.json['items']) == 10
+    assert len(count_queries) <= 2
+
+
+def test_export_query_count(client, count_queries):
+    response = client.get('/admin/export')
+    assert response.status_code == 200
+    assert len(response.json) == 10
+    assert len(count_queries) <= 2